@@ -33,6 +33,7 @@ a = Analysis(
         'pymongo',
         'dotenv',
         'csv',
+        'pandas',
         'datetime',
         'os',
         'sys',
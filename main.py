@@ -1,5 +1,7 @@
 import sys
 import os
+import logging
+from functools import lru_cache
 from PyQt5.QtWidgets import (
     QApplication,
     QWidget,
@@ -12,7 +14,7 @@ from PyQt5.QtWidgets import (
     QMessageBox,
     QFileDialog,
 )
-from PyQt5.QtCore import Qt, QPoint
+from PyQt5.QtCore import Qt, QPoint, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QPixmap
 from src.assets.reorder import CSVReorder, create_reorder_config
 from src.uiitems.close_button import CloseButton
@@ -29,6 +31,116 @@ def get_resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+@lru_cache(maxsize=8)
+def load_scaled_pixmap(path, width, height):
+    """Load and scale an image once, reusing the decoded pixmap afterwards"""
+    return QPixmap(path).scaled(
+        width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation
+    )
+
+
+GLOBAL_QSS = """
+    QWidget {
+        font-family: 'Arial';
+        background-color: transparent;
+        border: 2px solid #CDEBF0;
+        border-radius: 20px;
+    }
+    QPushButton {
+        background-color: #CDEBF0;
+        color: black;
+        font-weight: bold;
+        border-radius: 8px;
+        padding: 10px;
+        margin: 10px;
+    }
+    QPushButton:hover {
+        background-color: #BEE0E8;
+    }
+    QLabel#Logo {
+        background-color: transparent;
+    }
+    QLineEdit {
+        border: 2px solid #ccc;
+        border-radius: 8px;
+        padding: 8px;
+        margin: 10px;
+        color: black;
+        background-color: white;
+    }
+    QCheckBox {
+        background-color: #CDEBF0;
+        color: black;
+        font-weight: bold;
+        padding: 10px;
+        margin: 5px;
+        border-radius: 8px;
+        border: 2px solid #BEE0E8;
+    }
+    QCheckBox:hover {
+        background-color: #BEE0E8;
+    }
+    QCheckBox::indicator {
+        background-color: white;
+        border: 2px solid #BEE0E8;
+        width: 16px;
+        height: 16px;
+        border-radius: 3px;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #4A90E2;
+        border: 2px solid #4A90E2;
+    }
+    QMessageBox {
+        background-color: #CDEBF0;
+        color: black;
+        font-size: 16px;
+        border: 2px solid #BEE0E8;
+        border-radius: 12px;
+    }
+    QMessageBox QPushButton {
+        background-color: #CDEBF0;
+        color: black;
+        font-weight: bold;
+        border: 2px solid #BEE0E8;
+        border-radius: 8px;
+        padding: 8px 16px;
+        font-size: 14px;
+        min-width: 80px;
+        min-height: 35px;
+    }
+    QMessageBox QPushButton:hover {
+        background-color: #BEE0E8;
+    }
+"""
+
+
+class WorkerSignals(QObject):
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class ReorderWorker(QRunnable):
+    """在线程池中运行 CSV 重新排序，避免阻塞界面。"""
+
+    def __init__(self, reorder_util, input_file, output_directory):
+        super().__init__()
+        self.reorder_util = reorder_util
+        self.input_file = input_file
+        self.output_directory = output_directory
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.reorder_util.reorder_csv_safe(
+                self.input_file, self.output_directory
+            )
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
 class MainWorkflowApp(QWidget):
     def __init__(self):
         super().__init__()
@@ -47,52 +159,6 @@ class MainWorkflowApp(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setObjectName("App")
 
-        self.setStyleSheet(
-            """
-            QWidget {
-                font-family: 'Arial';
-                background-color: transparent; 
-                border: 2px solid #CDEBF0; 
-                border-radius: 20px;
-            }
-            QPushButton {
-                background-color: #CDEBF0;
-                color: black;
-                font-weight: bold;
-                border-radius: 8px;
-                padding: 10px;
-                margin: 10px;
-            }
-            QPushButton:hover {
-                background-color: #BEE0E8;
-            }
-            QLabel#Logo {
-                background-color: transparent;
-            }
-            QMessageBox {
-                background-color: #CDEBF0;
-                color: black;
-                font-size: 16px;
-                border: 2px solid #BEE0E8;
-                border-radius: 12px;
-            }
-            QMessageBox QPushButton {
-                background-color: #CDEBF0;
-                color: black;
-                font-weight: bold;
-                border: 2px solid #BEE0E8;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 14px;
-                min-width: 80px;
-                min-height: 35px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #BEE0E8;
-            }
-        """
-        )
-
         self.mainLayout = QVBoxLayout(self)
         self.mainLayout.setContentsMargins(5, 5, 5, 5)
         self.mainLayout.setSpacing(10)
@@ -117,42 +183,13 @@ class MainWorkflowApp(QWidget):
         # Create horizontal layout for checkboxes
         checkbox_layout = QHBoxLayout()
 
-        # Updated checkbox style to match button background
-        checkbox_style = """
-            QCheckBox {
-                background-color: #CDEBF0;
-                color: black;
-                font-weight: bold;
-                padding: 10px;
-                margin: 5px;
-                border-radius: 8px;
-                border: 2px solid #BEE0E8;
-            }
-            QCheckBox:hover {
-                background-color: #BEE0E8;
-            }
-            QCheckBox::indicator {
-                background-color: white;
-                border: 2px solid #BEE0E8;
-                width: 16px;
-                height: 16px;
-                border-radius: 3px;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #4A90E2;
-                border: 2px solid #4A90E2;
-            }
-        """
-
         self.use_language_sorting_checkbox = QCheckBox("Use Language Sorting", self)
-        self.use_language_sorting_checkbox.setStyleSheet(checkbox_style)
         self.use_language_sorting_checkbox.stateChanged.connect(
             self.toggle_language_sorting
         )
         checkbox_layout.addWidget(self.use_language_sorting_checkbox)
 
         self.reverse_sorting_checkbox = QCheckBox("Reverse Sorting", self)
-        self.reverse_sorting_checkbox.setStyleSheet(checkbox_style)
         self.reverse_sorting_checkbox.stateChanged.connect(self.toggle_reverse_sorting)
         checkbox_layout.addWidget(self.reverse_sorting_checkbox)
 
@@ -170,42 +207,15 @@ class MainWorkflowApp(QWidget):
         """创建按钮并设置点击事件。"""
         button = QPushButton(text, self)
         button.clicked.connect(slot)
-        button.setStyleSheet(
-            style
-            if style
-            else """
-            QPushButton {
-                background-color: #CDEBF0;
-                color: black;
-                font-weight: bold;
-                border-radius: 8px;
-                padding: 10px;
-                margin: 10px;
-            }
-            QPushButton:hover {
-                background-color: #BEE0E8;
-            }
-        """
-        )
+        if style:
+            button.setStyleSheet(style)
         return button
 
     def create_line_edit(self, placeholder, style=None):
         line_edit = QLineEdit(self)
         line_edit.setPlaceholderText(placeholder)
-        line_edit.setStyleSheet(
-            style
-            if style
-            else """
-            QLineEdit {
-                border: 2px solid #ccc;
-                border-radius: 8px;
-                padding: 8px;
-                margin: 10px;
-                color: black;
-                background-color: white;
-            }
-        """
-        )
+        if style:
+            line_edit.setStyleSheet(style)
         return line_edit
 
     def show_custom_message(self):
@@ -215,31 +225,6 @@ class MainWorkflowApp(QWidget):
         msg.setText("The workflow has been completed successfully.")
         msg.setWindowTitle("Success")
         msg.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog | Qt.CustomizeWindowHint)
-        msg.setStyleSheet(
-            """
-            QMessageBox {
-                background-color: #CDEBF0;
-                color: black;
-                font-size: 16px;
-                border: 2px solid #BEE0E8;
-                border-radius: 12px;
-            }
-            QMessageBox QPushButton {
-                background-color: #CDEBF0;
-                color: black;
-                font-weight: bold;
-                border: 2px solid #BEE0E8;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 14px;
-                min-width: 80px;
-                min-height: 35px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #BEE0E8;
-            }
-            """
-        )
         msg.exec_()
 
     def create_title_bar(self):
@@ -254,8 +239,7 @@ class MainWorkflowApp(QWidget):
         """创建 Logo 标签。"""
         logo = QLabel(self)
         cover_path = get_resource_path(os.path.join("static", "cover.png"))
-        pixmap = QPixmap(cover_path).scaled(500, 800)
-        logo.setPixmap(pixmap)
+        logo.setPixmap(load_scaled_pixmap(cover_path, 500, 800))
         logo.setAlignment(Qt.AlignCenter)
         logo.setObjectName("Logo")
         return logo
@@ -320,26 +304,39 @@ class MainWorkflowApp(QWidget):
 
             # Create CSV reorder instance
             reorder_util = CSVReorder(config)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+            return
 
-            # Perform the reordering using the safe method
-            result = reorder_util.reorder_csv_safe(
-                self.input_csv_file_path, self.output_directory
+        # Perform the reordering off the GUI thread so the window stays responsive
+        worker = ReorderWorker(
+            reorder_util, self.input_csv_file_path, self.output_directory
+        )
+        worker.signals.finished.connect(self.on_reorder_finished)
+        worker.signals.error.connect(self.on_reorder_error)
+        self.start_button.setEnabled(False)
+        QThreadPool.globalInstance().start(worker)
+
+    def on_reorder_finished(self, result):
+        """重新排序完成。"""
+        self.start_button.setEnabled(True)
+        if result:
+            QMessageBox.information(
+                self,
+                "Success",
+                f"CSV file has been reordered and saved as:\n{result}",
+            )
+        else:
+            QMessageBox.warning(
+                self,
+                "Error",
+                "CSV reordering failed. Please check the console for error messages.",
             )
 
-            if result:
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"CSV file has been reordered and saved as:\n{result}",
-                )
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Error",
-                    "CSV reordering failed. Please check the console for error messages.",
-                )
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
+    def on_reorder_error(self, message):
+        """重新排序出错。"""
+        self.start_button.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"An error occurred: {message}")
 
     def mousePressEvent(self, event):
         """鼠标按下事件。"""
@@ -358,7 +355,13 @@ class MainWorkflowApp(QWidget):
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        stream=sys.stdout,
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
     app = QApplication(sys.argv)
+    app.setStyleSheet(GLOBAL_QSS)
     window = MainWorkflowApp()
     window.show()
     sys.exit(app.exec_())
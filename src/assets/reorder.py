@@ -5,14 +5,68 @@ A robust, class-based CSV reordering utility with comprehensive error handling,
 logging, type hints, and production-ready features.
 """
 
+import codecs
 import csv
+import heapq
+import io
 import logging
 import sys
+import tempfile
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+# Library logger; the application decides where records go
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Category used for languages missing from the configured language order
+_OTHER_LANGUAGE = "__other__"
+
+# Detected format of a date column in which no sampled value is a date
+_TEXT_COLUMN = "__text__"
+
+
+def _parse_iso_date(date_string: str) -> Optional[datetime]:
+    """Parse YYYY-MM-DD, YYYY/MM/DD or YYYY by slicing, or return None."""
+    try:
+        if len(date_string) == 10 and date_string[4] == date_string[7] in "-/":
+            year, month, day = date_string[:4], date_string[5:7], date_string[8:]
+            if year.isdigit() and month.isdigit() and day.isdigit():
+                return datetime(int(year), int(month), int(day))
+        elif len(date_string) == 4 and date_string.isdigit():
+            return datetime(int(date_string), 1, 1)
+    except ValueError:
+        pass
+    return None
+
+
+@lru_cache(maxsize=100_000)
+def _parse_date_cached(
+    date_string: str, formats: Tuple[str, ...]
+) -> Optional[datetime]:
+    """Parse a stripped date string with the first matching format, or None."""
+    for fmt in formats:
+        try:
+            return datetime.strptime(date_string, fmt)
+        except ValueError:
+            continue
+    return None
+
 
 @dataclass
 class SortColumn:
@@ -38,11 +92,20 @@ class CSVReorderConfig:
     language_order: List[str] = field(default_factory=lambda: ["EN", "CN"])
     output_prefix: str = "sorted_"
     encoding: str = "utf-8"
+    # Compare text columns as they are instead of case-folding them
+    case_sensitive: bool = False
+    # Files larger than large_file_threshold bytes are sorted in chunks of
+    # chunk_size rows and merged on disk; None always sorts in memory
+    chunk_size: Optional[int] = 1_000_000
+    large_file_threshold: int = 512 * 1024 * 1024
 
     def __post_init__(self):
         if not self.sort_columns:
             raise ValueError("At least one sort column must be specified")
 
+        if self.chunk_size is not None and self.chunk_size <= 0:
+            raise ValueError("Chunk size must be a positive number of rows")
+
         if self.use_language_sorting and not self.language_column.strip():
             raise ValueError(
                 "Language column name cannot be empty when language sorting is enabled"
@@ -85,6 +148,14 @@ class CSVReorder:
         "%Y.%m.%d",
     ]
 
+    # Number of leading values inspected when detecting a date column's format
+    DATE_SAMPLE_SIZE = 1000
+
+    # Number of leading values inspected when deciding whether to factorize a
+    # string key, and the largest distinct fraction that is still factorized
+    FACTORIZE_SAMPLE_SIZE = 1000
+    FACTORIZE_MAX_DISTINCT = 0.5
+
     def __init__(
         self, config: CSVReorderConfig, logger: Optional[logging.Logger] = None
     ):
@@ -93,27 +164,12 @@ class CSVReorder:
 
         Args:
             config: Configuration object containing reordering parameters
-            logger: Optional logger instance. If None, a default logger will be created
+            logger: Optional logger instance. If None, the module logger is used
         """
         self.config = config
-        self.logger = logger or self._setup_default_logger()
+        self.logger = logger or logging.getLogger(__name__)
         self._validate_config()
 
-    def _setup_default_logger(self) -> logging.Logger:
-        """Set up a default logger with appropriate formatting."""
-        logger = logging.getLogger(__name__)
-        logger.setLevel(logging.INFO)
-
-        if not logger.handlers:
-            handler = logging.StreamHandler(sys.stdout)
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-
-        return logger
-
     def _validate_config(self) -> None:
         """Validate the configuration object."""
         try:
@@ -146,11 +202,15 @@ class CSVReorder:
 
         date_string = date_string.strip()
 
-        for fmt in self.DATE_FORMATS:
-            try:
-                return datetime.strptime(date_string, fmt)
-            except ValueError:
-                continue
+        # These shapes match the leading DATE_FORMATS entries, so the fast
+        # path returns what strptime would
+        parsed = _parse_iso_date(date_string)
+        if parsed is not None:
+            return parsed
+
+        parsed = _parse_date_cached(date_string, tuple(self.DATE_FORMATS))
+        if parsed is not None:
+            return parsed
 
         self.logger.warning(f"Could not parse date: '{date_string}'")
         return date_string
@@ -186,89 +246,562 @@ class CSVReorder:
                 f"Language column '{self.config.language_column}' missing from CSV"
             )
 
-    def _create_sort_key(self, row: Dict[str, Any]) -> Tuple:
+    def _build_key_arrays(
+        self,
+        data: pd.DataFrame,
+        date_formats: Optional[Dict[str, Optional[str]]] = None,
+    ) -> List[np.ndarray]:
         """
-        Create a sort key for a CSV row.
+        Build one sort key array per key column of a CSV data frame.
+
+        Language keys are category codes and date keys are int64 seconds,
+        with NaT as the smallest value so unparseable dates sort before valid
+        ones and reverse order is an exact mirror. String keys stay strings.
 
         Args:
-            row: Dictionary representing a CSV row
+            data: Data frame holding the CSV rows as strings
+            date_formats: Detected format per date column. Missing entries are
+                detected and stored, so chunks of one file parse dates alike
 
         Returns:
-            Tuple to be used as sort key
+            Key arrays in sort priority order, aligned with the rows of data
         """
+        if date_formats is None:
+            date_formats = {}
+
         try:
-            key_parts = []
+            keys = []
 
             # Add language sorting if enabled
             if self.config.use_language_sorting:
-                lang_value = row.get(self.config.language_column, "").strip()
-                try:
-                    lang_index = self.config.language_order.index(lang_value)
-                except ValueError:
-                    lang_index = len(
-                        self.config.language_order
-                    )  # Unknown languages go last
-                key_parts.append(lang_index)
+                language_order = list(dict.fromkeys(self.config.language_order))
+                language_dtype = pd.CategoricalDtype(
+                    categories=language_order + [_OTHER_LANGUAGE], ordered=True
+                )
+                lang_values = data[self.config.language_column].str.strip()
+                # Unknown languages go last
+                lang_values = lang_values.where(
+                    lang_values.isin(language_order), _OTHER_LANGUAGE
+                )
+                lang_codes = lang_values.astype(language_dtype).cat.codes
+                keys.append(lang_codes.to_numpy(dtype="int64"))
 
             # Add sort columns
             for sort_col in self.config.sort_columns:
-                value = row.get(sort_col.name, "")
-
-                if sort_col.is_date and value:
-                    parsed_value = self.parse_date(str(value))
-                    key_parts.append(parsed_value)
+                values = data[sort_col.name]
+
+                if sort_col.is_date and sort_col.name not in date_formats:
+                    date_formats[sort_col.name] = self._detect_date_format(values)
+
+                if sort_col.is_date and date_formats[sort_col.name] != _TEXT_COLUMN:
+                    dates = self._parse_date_column(values, date_formats[sort_col.name])
+                    # pandas may parse at s, us or ns resolution; converting
+                    # to ns would silently overflow for years outside 1677-2262
+                    dates = dates.astype("datetime64[s]")
+                    keys.append(dates.to_numpy().view("int64"))
+                elif self.config.case_sensitive:
+                    keys.append(values.to_numpy(dtype=object))
                 else:
-                    # For string sorting, convert to lowercase for case-insensitive comparison
-                    string_value = str(value).lower() if value else ""
-                    key_parts.append(string_value)
+                    # For string sorting, case-fold for case-insensitive comparison
+                    # (also folds e.g. "ß" to "ss", which lower() leaves alone)
+                    keys.append(values.str.casefold().to_numpy(dtype=object))
 
-            return tuple(key_parts)
+            return keys
 
         except KeyError as e:
-            raise CSVReorderError(f"Column not found in CSV row: {e}")
+            raise CSVReorderError(f"Column not found in CSV: {e}")
         except Exception as e:
             raise CSVReorderError(f"Error creating sort key: {e}")
 
-    def _read_csv_file(self, file_path: Path) -> Tuple[List[str], List[Dict[str, Any]]]:
+    def _detect_date_format(self, values: pd.Series) -> Optional[str]:
         """
-        Read and parse the CSV file.
+        Detect the DATE_FORMATS entry that best fits a column of date strings.
+
+        Args:
+            values: Column of date strings
+
+        Returns:
+            The format matching the most sampled values, None if none match,
+            or _TEXT_COLUMN if no sampled value parses as a date at all
+        """
+        sample = values.head(self.DATE_SAMPLE_SIZE).str.strip()
+        sample = pd.Series(sample[sample.ne("")].unique(), dtype=object)
+
+        best_format, best_matches = None, 0
+        for fmt in self.DATE_FORMATS:
+            # One compiled parse per format instead of a strptime call per value
+            matches = int(
+                pd.to_datetime(sample, format=fmt, errors="coerce").notna().sum()
+            )
+            # Earlier formats win ties, matching parse_date's priority order
+            if matches > best_matches:
+                best_format, best_matches = fmt, matches
+            if matches == len(sample):
+                break
+
+        # pandas rejects some dates strptime accepts (e.g. years before 1677),
+        # so only values neither can parse make the column text
+        formats = tuple(self.DATE_FORMATS)
+        if (
+            best_format is None
+            and not sample.empty
+            and not any(
+                _parse_iso_date(value) or _parse_date_cached(value, formats)
+                for value in sample
+            )
+        ):
+            self.logger.warning(
+                f"No dates found in column '{values.name}', sorting it as text"
+            )
+            return _TEXT_COLUMN
+
+        return best_format
+
+    def _parse_date_column(
+        self, values: pd.Series, date_format: Optional[str]
+    ) -> pd.Series:
+        """
+        Parse a column of date strings, leaving NaT where parsing fails.
+
+        Args:
+            values: Column of date strings
+            date_format: Format detected for the column, if any
+
+        Returns:
+            Series of datetimes aligned with values
+        """
+        stripped = values.str.strip()
+        if date_format is not None:
+            parsed = pd.to_datetime(
+                stripped, format=date_format, errors="coerce", cache=True
+            )
+        else:
+            parsed = pd.Series(pd.NaT, index=stripped.index, dtype="datetime64[ns]")
+
+        # Retry values not in the detected format against the other
+        # DATE_FORMATS in priority order, one vectorized pass per format
+        unparsed = parsed.isna() & stripped.ne("")
+        for fmt in self.DATE_FORMATS:
+            if not unparsed.any():
+                break
+            if fmt == date_format:
+                continue
+            parsed[unparsed] = pd.to_datetime(
+                stripped[unparsed], format=fmt, errors="coerce", cache=True
+            )
+            unparsed &= parsed.isna()
+
+        # Whatever is left goes through parse_date, once per distinct value
+        if unparsed.any():
+            fallback = {}
+            for value in stripped[unparsed].unique():
+                parsed_value = self.parse_date(value)
+                fallback[value] = (
+                    parsed_value if isinstance(parsed_value, datetime) else None
+                )
+            # strptime accepts years outside pandas' nanosecond range, so the
+            # retried dates are stored at second resolution
+            parsed = parsed.astype("datetime64[s]")
+            parsed[unparsed] = np.array(
+                [fallback[value] for value in stripped[unparsed]],
+                dtype="datetime64[s]",
+            )
+
+        return parsed
+
+    def _factorize_string_key(self, key: np.ndarray) -> np.ndarray:
+        """
+        Replace a string key by its rank among the distinct values, if few.
+
+        Comparing int64 ranks is cheaper than comparing repeated strings, but
+        factorizing a nearly unique column costs more than the sort saves.
+
+        Args:
+            key: Object array of strings
+
+        Returns:
+            int64 ranks, or the key itself when its values are mostly distinct
+        """
+        sample = key[: self.FACTORIZE_SAMPLE_SIZE]
+        if len(pd.unique(sample)) > len(sample) * self.FACTORIZE_MAX_DISTINCT:
+            return key
+        return pd.factorize(key, sort=True)[0]
+
+    def _sort_order(self, keys: List[np.ndarray]) -> np.ndarray:
+        """
+        Compute the stable sorted row order for a set of key arrays.
+
+        Args:
+            keys: Key arrays as returned by _build_key_arrays
+
+        Returns:
+            Array of row positions in sorted order
+        """
+        keys = [
+            self._factorize_string_key(key) if key.dtype == object else key
+            for key in keys
+        ]
+
+        if pa is not None:
+            # Arrow's multi-key sort is stable in both directions and runs
+            # without holding the GIL. Strings left unfactorized are compared
+            # natively, in the same code point order as Python
+            table = pa.table(
+                {
+                    str(i): pa.array(key, pa.string()) if key.dtype == object else key
+                    for i, key in enumerate(keys)
+                }
+            )
+            direction = "descending" if self.config.reverse else "ascending"
+            indices = pc.sort_indices(
+                table, sort_keys=[(name, direction) for name in table.column_names]
+            )
+            return indices.to_numpy()
+
+        if not self.config.reverse:
+            # np.lexsort treats its last key as the primary one
+            return np.lexsort(keys[::-1])
+
+        # Sort the rows back to front and flip the result, which gives a
+        # descending order that still keeps tied rows in input order
+        order = np.lexsort([key[::-1] for key in reversed(keys)])
+        return (len(keys[0]) - 1 - order)[::-1]
+
+    def _key_column_names(self) -> List[str]:
+        """Return the CSV columns the sort keys are built from."""
+        names = [col.name for col in self.config.sort_columns]
+        if self.config.use_language_sorting:
+            names.insert(0, self.config.language_column)
+        return list(dict.fromkeys(names))
+
+    def _sort_csv_in_chunks(
+        self, file_path: Path, chunk_dir: Path
+    ) -> Tuple[List[str], List[Path], int, int]:
+        """
+        Sort a CSV file chunk by chunk into temporary files.
+
+        Each chunk file has no header; its leading columns are the sort keys
+        rendered by _merge_key_strings, followed by the original row.
 
         Args:
             file_path: Path to the CSV file
+            chunk_dir: Directory to write the sorted chunk files to
+
+        Returns:
+            Tuple of (fieldnames, chunk_paths, key_count, row_count)
+        """
+        chunk_paths: List[Path] = []
+        key_count = 0
+        row_count = 0
+
+        try:
+            # Detect date formats from the leading rows of the file, as the
+            # in-memory path does, rather than from the first chunk
+            fieldnames, sample = self._read_csv_file(
+                file_path, nrows=self.DATE_SAMPLE_SIZE
+            )
+            self._validate_csv_columns(fieldnames)
+            date_formats: Dict[str, Optional[str]] = {
+                sort_col.name: self._detect_date_format(sample[sort_col.name])
+                for sort_col in self.config.sort_columns
+                if sort_col.is_date
+            }
+            del sample
+
+            reader = pd.read_csv(
+                file_path,
+                sep=self._sniff_delimiter(file_path),
+                dtype=str,
+                keep_default_na=False,
+                encoding=self.config.encoding,
+                chunksize=self.config.chunk_size,
+            )
+            with reader:
+                for chunk in reader:
+                    if chunk.empty:
+                        continue
+
+                    keys = self._build_key_arrays(chunk, date_formats)
+                    order = self._sort_order(keys)
+                    key_count = len(keys)
+
+                    sorted_chunk = chunk.iloc[order]
+                    sorted_keys = pd.DataFrame(
+                        {
+                            i: self._merge_key_strings(key[order])
+                            for i, key in enumerate(keys)
+                        },
+                        index=sorted_chunk.index,
+                    )
+                    chunk_path = chunk_dir / f"chunk_{len(chunk_paths)}.csv"
+                    pd.concat([sorted_keys, sorted_chunk], axis=1).to_csv(
+                        chunk_path, header=False, index=False, encoding="utf-8"
+                    )
+                    chunk_paths.append(chunk_path)
+                    row_count += len(chunk)
+
+            self.logger.info(
+                f"Sorted {row_count} rows from {file_path} "
+                f"in {len(chunk_paths)} chunks"
+            )
+            return fieldnames, chunk_paths, key_count, row_count
+
+        except CSVReorderError:
+            raise
+        except UnicodeDecodeError as e:
+            raise CSVReorderError(f"Encoding error reading CSV file: {e}")
+        except (csv.Error, pd.errors.ParserError, pd.errors.EmptyDataError) as e:
+            raise CSVReorderError(f"CSV parsing error: {e}")
+        except Exception as e:
+            raise CSVReorderError(f"Error reading CSV file: {e}")
+
+    @staticmethod
+    def _merge_key_strings(key: np.ndarray) -> np.ndarray:
+        """
+        Render a key array as strings that sort in the same order.
+
+        Flipping the sign bit maps int64 onto uint64 in order, and zero-padding
+        to 20 digits makes string order match numeric order. Chunk rows can
+        then be merged straight from csv.reader lists without converting cells.
+
+        Args:
+            key: Key array as returned by _build_key_arrays
 
         Returns:
-            Tuple of (fieldnames, data_rows)
+            Array of strings
+        """
+        if key.dtype == object:
+            return key
+        unsigned = key.view(np.uint64) ^ np.uint64(1 << 63)
+        return np.char.zfill(unsigned.astype(str), 20)
+
+    def _iter_chunk_rows(self, chunk_path: Path) -> Iterator[List[str]]:
+        """Stream the rows of a sorted chunk file as lists of strings."""
+        with open(chunk_path, "r", newline="", encoding="utf-8") as chunk_file:
+            yield from csv.reader(chunk_file)
+
+    def _merge_sorted_chunks(
+        self,
+        file_path: Path,
+        fieldnames: List[str],
+        chunk_paths: List[Path],
+        key_count: int,
+    ) -> None:
+        """
+        Merge sorted chunk files into the final CSV file.
+
+        Args:
+            file_path: Output file path
+            fieldnames: Column names
+            chunk_paths: Sorted chunk files, in input order
+            key_count: Number of leading key columns in each chunk file
         """
         try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # csv.reader, itemgetter slices and writerows all run in C, so the
+            # per-row read, merge and write loops never enter a Python frame
+            merged = heapq.merge(
+                *(self._iter_chunk_rows(path) for path in chunk_paths),
+                key=itemgetter(slice(None, key_count)),
+                reverse=self.config.reverse,
+            )
+
             with open(
-                file_path, "r", newline="", encoding=self.config.encoding
+                file_path, "w", newline="", encoding=self.config.encoding
             ) as csvfile:
-                # Detect delimiter
-                sample = csvfile.read(1024)
-                csvfile.seek(0)
-                sniffer = csv.Sniffer()
-                delimiter = sniffer.sniff(sample).delimiter
+                writer = csv.writer(csvfile)
+                writer.writerow(fieldnames)
+                writer.writerows(map(itemgetter(slice(key_count, None)), merged))
+
+        except Exception as e:
+            raise CSVReorderError(f"Error writing CSV file: {e}")
+
+    def _reorder_csv_in_chunks(self, input_path: Path, output_path: Path) -> None:
+        """
+        Reorder a CSV file too large to sort in memory with an external merge sort.
+
+        Args:
+            input_path: Path to the input CSV file
+            output_path: Path to write the sorted CSV file to
+        """
+        with tempfile.TemporaryDirectory(prefix="csv_reorder_") as chunk_dir:
+            fieldnames, chunk_paths, key_count, row_count = self._sort_csv_in_chunks(
+                input_path, Path(chunk_dir)
+            )
+
+            if not row_count:
+                raise CSVReorderError("The input CSV file contains no data rows")
+
+            self.logger.info(f"Merging {len(chunk_paths)} sorted chunks...")
+            self._merge_sorted_chunks(output_path, fieldnames, chunk_paths, key_count)
+
+        self.logger.info(f"Successfully wrote {row_count} rows to {output_path}")
+
+    def _sniff_delimiter(self, file_path: Path) -> str:
+        """Detect the delimiter of a CSV file from its first kilobyte."""
+        with open(file_path, "r", newline="", encoding=self.config.encoding) as csvfile:
+            sample = csvfile.read(1024)
+        sniffer = csv.Sniffer()
+        return sniffer.sniff(sample).delimiter
+
+    def _read_header(self, file_path: Path, delimiter: str) -> List[str]:
+        """Read the header row of a CSV file as the csv module parses it."""
+        with open(file_path, "r", newline="", encoding=self.config.encoding) as csvfile:
+            return next(csv.reader(csvfile, delimiter=delimiter), [])
+
+    def _read_csv_with_arrow(
+        self,
+        file_path: Path,
+        delimiter: str,
+        header: List[str],
+        usecols: Optional[List[str]] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Read a CSV file with pyarrow's multithreaded C++ reader, if possible.
+
+        Every column is read as a string and empty cells stay empty strings,
+        matching the pandas reader. Files pyarrow cannot read that way are
+        left to the pandas reader.
+
+        Args:
+            file_path: Path to the CSV file
+            delimiter: Field delimiter
+            header: Header row as read by _read_header
+            usecols: Columns to read, or None for all columns
+
+        Returns:
+            The data rows, or None if the caller must read the file
+        """
+        if pa is None or codecs.lookup(self.config.encoding).name != "utf-8":
+            return None
+        if not header:
+            return None
+
+        convert_options = pacsv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+            strings_can_be_null=False,
+            include_columns=usecols,
+        )
+        try:
+            table = pacsv.read_csv(
+                file_path,
+                read_options=pacsv.ReadOptions(use_threads=True),
+                parse_options=pacsv.ParseOptions(
+                    delimiter=delimiter, newlines_in_values=True
+                ),
+                convert_options=convert_options,
+            )
+        except pa.ArrowInvalid:
+            return None
 
-                reader = csv.DictReader(csvfile, delimiter=delimiter)
-                fieldnames = reader.fieldnames
+        # A header that differs from the csv module's reading (e.g. a byte
+        # order mark) leaves its column with an inferred type
+        if not all(pa.types.is_string(column.type) for column in table.columns):
+            return None
+        return table.to_pandas()
+
+    def _read_csv_file(
+        self,
+        file_path: Path,
+        usecols: Optional[List[str]] = None,
+        nrows: Optional[int] = None,
+    ) -> Tuple[List[str], pd.DataFrame]:
+        """
+        Read and parse the CSV file.
 
-                if not fieldnames:
-                    raise CSVReorderError("CSV file has no header row")
+        All cells are read as strings so values are written back unchanged.
 
-                data = list(reader)
+        Args:
+            file_path: Path to the CSV file
+            usecols: Columns to read, or None for all columns
+            nrows: Number of rows to read, or None for all rows
 
-            self.logger.info(f"Successfully read {len(data)} rows from {file_path}")
+        Returns:
+            Tuple of (fieldnames, data_frame)
+        """
+        try:
+            delimiter = self._sniff_delimiter(file_path)
+            header = self._read_header(file_path, delimiter)
+
+            # pandas would rename a repeated column (a, a.1), so the header
+            # written back would no longer match the input
+            duplicates = [name for name, count in Counter(header).items() if count > 1]
+            if duplicates:
+                raise CSVReorderError(f"Duplicate column names in CSV: {duplicates}")
+
+            data = None
+            if nrows is None:
+                data = self._read_csv_with_arrow(file_path, delimiter, header, usecols)
+            if data is None:
+                data = pd.read_csv(
+                    file_path,
+                    sep=delimiter,
+                    dtype=str,
+                    keep_default_na=False,
+                    encoding=self.config.encoding,
+                    usecols=usecols,
+                    nrows=nrows,
+                )
+            fieldnames = list(data.columns)
+
+            if not fieldnames:
+                raise CSVReorderError("CSV file has no header row")
+
+            if nrows is None:
+                self.logger.info(f"Successfully read {len(data)} rows from {file_path}")
             return fieldnames, data
 
+        except CSVReorderError:
+            raise
         except UnicodeDecodeError as e:
             raise CSVReorderError(f"Encoding error reading CSV file: {e}")
-        except csv.Error as e:
+        except (csv.Error, pd.errors.ParserError, pd.errors.EmptyDataError) as e:
             raise CSVReorderError(f"CSV parsing error: {e}")
         except Exception as e:
             raise CSVReorderError(f"Error reading CSV file: {e}")
 
+    def _write_csv_with_arrow(
+        self, file_path: Path, fieldnames: List[str], data: pd.DataFrame
+    ) -> bool:
+        """
+        Write a CSV file with pyarrow's multithreaded C++ writer, if possible.
+
+        pyarrow can only quote every string or none, so rows are written
+        unquoted and the csv module's minimal quoting is matched byte for
+        byte. Data that needs quoting is left to the pandas writer.
+
+        Args:
+            file_path: Output file path
+            fieldnames: Column names
+            data: Sorted data rows
+
+        Returns:
+            True if the file was written, False if the caller must write it
+        """
+        if pa is None or codecs.lookup(self.config.encoding).name != "utf-8":
+            return False
+        # An empty cell in a one-column file must be quoted to stay a row
+        if len(fieldnames) < 2:
+            return False
+
+        header = io.StringIO()
+        csv.writer(header).writerow(fieldnames)
+        table = pa.Table.from_pandas(data[fieldnames], preserve_index=False)
+        write_options = pacsv.WriteOptions(
+            include_header=False, quoting_style="none", eol="\r\n"
+        )
+
+        try:
+            with open(file_path, "wb") as csvfile:
+                csvfile.write(header.getvalue().encode(self.config.encoding))
+                pacsv.write_csv(table, csvfile, write_options=write_options)
+        except pa.ArrowInvalid:
+            return False
+        return True
+
     def _write_csv_file(
-        self, file_path: Path, fieldnames: List[str], data: List[Dict[str, Any]]
+        self, file_path: Path, fieldnames: List[str], data: pd.DataFrame
     ) -> None:
         """
         Write sorted data to a CSV file.
@@ -282,12 +815,15 @@ class CSVReorder:
             # Ensure output directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(
-                file_path, "w", newline="", encoding=self.config.encoding
-            ) as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(data)
+            if not self._write_csv_with_arrow(file_path, fieldnames, data):
+                data.to_csv(
+                    file_path,
+                    columns=fieldnames,
+                    index=False,
+                    encoding=self.config.encoding,
+                    # Keep the csv module's (excel dialect) line endings
+                    lineterminator="\r\n",
+                )
 
             self.logger.info(f"Successfully wrote {len(data)} rows to {file_path}")
 
@@ -321,27 +857,45 @@ class CSVReorder:
             if not input_path.is_file():
                 raise CSVReorderError(f"Input path is not a file: {input_path}")
 
-            # Read CSV file
-            fieldnames, data = self._read_csv_file(input_path)
-
-            if not data:
-                raise CSVReorderError("The input CSV file contains no data rows")
+            # Generate output file path
+            output_filename = f"{self.config.output_prefix}{input_path.name}"
+            output_path = output_dir / output_filename
 
-            # Validate columns
+            # Sort large files in chunks on disk to bound memory use
+            if (
+                self.config.chunk_size is not None
+                and input_path.stat().st_size > self.config.large_file_threshold
+            ):
+                self.logger.info("Sorting CSV data in chunks...")
+                self._reorder_csv_in_chunks(input_path, output_path)
+                self.logger.info(
+                    f"CSV reordering completed successfully: {output_path}"
+                )
+                return output_path
+
+            # Validate columns from the header before parsing any rows
+            fieldnames, _ = self._read_csv_file(input_path, nrows=0)
             self._validate_csv_columns(fieldnames)
 
-            # Sort the data
+            # Sort on the key columns alone, so the keys are freed before the
+            # full rows are loaded
             self.logger.info("Sorting CSV data...")
-            sorted_data = sorted(
-                data, key=self._create_sort_key, reverse=self.config.reverse
+            _, key_data = self._read_csv_file(
+                input_path, usecols=self._key_column_names()
             )
 
-            # Generate output file path
-            output_filename = f"{self.config.output_prefix}{input_path.name}"
-            output_path = output_dir / output_filename
+            if key_data.empty:
+                raise CSVReorderError("The input CSV file contains no data rows")
+
+            keys = self._build_key_arrays(key_data)
+            order = self._sort_order(keys)
+            del key_data, keys
+
+            # Read CSV file
+            _, data = self._read_csv_file(input_path)
 
             # Write sorted data
-            self._write_csv_file(output_path, fieldnames, sorted_data)
+            self._write_csv_file(output_path, fieldnames, data.iloc[order])
 
             self.logger.info(f"CSV reordering completed successfully: {output_path}")
             return output_path